@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Annotated, Optional, List
+from array import array
+from typing import Annotated, Iterator, Optional, List
 from pydantic import BaseModel, Field, StringConstraints, field_validator
 import pandas as pd
 
@@ -130,6 +131,240 @@ class PandasClaimRepository(ClaimRepository):
         raise NotImplementedError("PandasClaimRepository ออกแบบมาให้อ่านอย่างเดียวครับป๋า!")
 
 
+# --- ลูกคนที่ 3: Columnar (เก็บเป็นคอลัมน์ ประหยัด RAM) ---
+class ClaimCaseStore:
+    """
+    เก็บ ClaimCase เป็น array ขนานกัน (ticket_id / amount / currency / version)
+    แทนที่จะถือ list ของ object ซ้อนกันหลายชั้น
+    - currency (ค่าซ้ำเยอะ) ถูกแปลงเป็นเลขรหัส (int) ผ่านตาราง _strings
+    - tracking / ticket_id ไม่ซ้ำกันอยู่แล้ว เก็บเป็น str ตรงๆ
+    - ใบเคลมของแต่ละเคสอยู่ติดกันในช่วง [start, start + count) ที่จองไว้ capacity แถว
+    - ClaimCase / ClaimTicket ถูกสร้างขึ้นใหม่เฉพาะตอนเรียกอ่าน (view)
+    - put() ตรวจทุกใบเคลมในเคสด้วยการเช็ก attribute ตรงๆ (ไม่ผ่าน Pydantic)
+      ต้นทุนยังเป็น O(จำนวนใบเคลมในเคส) ต่อการ save 1 ครั้ง แต่เขียนเฉพาะแถวที่เปลี่ยน
+    """
+    def __init__(self):
+        self._strings: list[str] = []
+        self._string_codes: dict[str, int] = {}
+
+        # คอลัมน์ระดับใบเคลม (1 แถว = 1 ClaimTicket)
+        self._ticket_ids: list[str] = []
+        self._amounts = array('d')
+        self._currency_codes = array('q')
+        self._versions = array('q')
+
+        # คอลัมน์ระดับเคส (1 แถว = 1 ClaimCase)
+        self._case_index: dict[str, int] = {}
+        self._case_tracking_values: list[str] = []
+        self._case_starts = array('q')
+        self._case_counts = array('q')
+        self._case_capacities = array('q')
+        self._case_totals = array('d')
+        self._case_total_currency_codes = array('q')
+
+    def __len__(self) -> int:
+        return len(self._case_tracking_values)
+
+    def __contains__(self, tracking_value: str) -> bool:
+        return tracking_value in self._case_index
+
+    @property
+    def ticket_count(self) -> int:
+        return sum(self._case_counts)
+
+    @property
+    def row_count(self) -> int:
+        # จำนวนแถวที่จองไว้จริงในคอลัมน์ (รวมแถวว่างที่เผื่อไว้)
+        return len(self._ticket_ids)
+
+    def _encode(self, text: str) -> int:
+        code = self._string_codes.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(text)
+            self._string_codes[text] = code
+        return code
+
+    @staticmethod
+    def _check_money(money: Money):
+        # กฎเดียวกับ Money (amount >= 0, สกุลเงิน 3 ตัวพิมพ์ใหญ่) แต่เช็กตรงๆ ให้เร็ว
+        amount, currency = money.amount, money.currency
+        if not isinstance(amount, (int, float)) or not amount >= 0:
+            raise ValueError(f'ยอดเงินต้องไม่ติดลบ: {amount!r}')
+        if not isinstance(currency, str) or len(currency) != 3 or currency != currency.strip().upper():
+            raise ValueError(f'สกุลเงินไม่ถูกต้อง: {currency!r}')
+
+    def _check(self, claim_case: ClaimCase) -> str:
+        # ตรวจข้อมูลซ้ำก่อนเขียน เพราะ field ถูกแก้ตรงๆ ได้โดยไม่ผ่าน validation
+        tracking_value = claim_case.tracking_number.value
+        if not isinstance(tracking_value, str) or tracking_value != tracking_value.strip() or len(tracking_value) < 5:
+            raise ValueError(f'Tracking Number ไม่ถูกต้อง: {tracking_value!r}')
+        self._check_money(claim_case.total_compensation)
+        for ticket in claim_case.tickets:
+            if ticket.tracking_number.value != tracking_value:
+                raise ValueError("ป๋าครับ! ใบเคลมคนละเลข Tracking กันนะ")
+            ticket_id = ticket.ticket_id.value
+            if not isinstance(ticket_id, str) or not ticket_id or ticket_id != ticket_id.strip():
+                raise ValueError(f'Ticket Id ไม่ถูกต้อง: {ticket_id!r}')
+            self._check_money(ticket.compensation_amount)
+        return tracking_value
+
+    def put(self, claim_case: ClaimCase):
+        tracking_value = self._check(claim_case)
+        tickets = claim_case.tickets
+        total = claim_case.total_compensation
+
+        count = len(tickets)
+        pos = self._case_index.get(tracking_value)
+
+        if pos is None:
+            # เคสใหม่ -> จองแถวต่อท้ายเท่าที่ใช้
+            start, capacity = self.row_count, count
+            self._grow(count)
+        else:
+            start, capacity = self._case_starts[pos], self._case_capacities[pos]
+            if count > capacity:
+                if start + capacity == self.row_count:
+                    # ช่วงเดิมอยู่ท้ายสุด -> ขยายต่อได้เลย ไม่ต้องย้าย
+                    self._grow(count - capacity)
+                    capacity = count
+                else:
+                    # ย้ายไปท้ายสุดและจองเผื่อเป็น 2 เท่า ช่วงเก่าที่ทิ้งไว้จะไม่เกินขนาดช่วงใหม่
+                    self._clear_rows(start, start + self._case_counts[pos])
+                    start, capacity = self.row_count, max(count, 2 * capacity)
+                    self._grow(capacity)
+            else:
+                # ใบเคลมเท่าเดิมหรือลดลง -> เขียนทับที่เดิม แถวท้ายที่เหลือเก็บไว้ใช้ตอนขยาย
+                self._clear_rows(start + count, start + self._case_counts[pos])
+
+        for i, ticket in enumerate(tickets):
+            self._write_ticket(start + i, ticket)
+
+        if pos is None:
+            self._case_index[tracking_value] = len(self._case_tracking_values)
+            self._case_tracking_values.append(tracking_value)
+            self._case_starts.append(start)
+            self._case_counts.append(count)
+            self._case_capacities.append(capacity)
+            self._case_totals.append(total.amount)
+            self._case_total_currency_codes.append(self._encode(total.currency))
+        else:
+            self._case_starts[pos] = start
+            self._case_counts[pos] = count
+            self._case_capacities[pos] = capacity
+            self._case_totals[pos] = total.amount
+            self._case_total_currency_codes[pos] = self._encode(total.currency)
+
+    def _grow(self, n: int):
+        self._ticket_ids.extend([""] * n)
+        self._amounts.extend([0.0] * n)
+        self._currency_codes.extend([0] * n)
+        self._versions.extend([0] * n)
+
+    def _clear_rows(self, begin: int, end: int):
+        # ปล่อย str ของ ticket_id ที่ไม่ได้ใช้แล้ว ให้ GC เก็บไปได้
+        for row in range(begin, end):
+            self._ticket_ids[row] = ""
+
+    def _write_ticket(self, row: int, ticket: ClaimTicket):
+        # แถวที่ข้อมูลเหมือนเดิมไม่ต้องเขียนทับ
+        ticket_id = ticket.ticket_id.value
+        money = ticket.compensation_amount
+        currency_code = self._string_codes.get(money.currency)
+        if (self._ticket_ids[row] == ticket_id and self._amounts[row] == money.amount
+                and self._currency_codes[row] == currency_code and self._versions[row] == ticket.version):
+            return
+        self._ticket_ids[row] = ticket_id
+        self._amounts[row] = money.amount
+        self._currency_codes[row] = self._encode(money.currency)
+        self._versions[row] = ticket.version
+
+    def get(self, tracking_value: str) -> Optional[ClaimCase]:
+        pos = self._case_index.get(tracking_value)
+        if pos is None:
+            return None
+        return self._build_case(pos)
+
+    def cases(self) -> Iterator[ClaimCase]:
+        # สร้าง view ทีละเคส ไม่ต้องถือ object ทั้งหมดไว้ใน RAM พร้อมกัน
+        for pos in range(len(self._case_tracking_values)):
+            yield self._build_case(pos)
+
+    def total_amount(self) -> Money:
+        # สแกนยอดรวมจากคอลัมน์ตรงๆ โดยไม่ต้องสร้าง object (ห้ามรวมคนละสกุลเงิน เหมือน Money.add)
+        codes = set(self._case_total_currency_codes)
+        if len(codes) > 1:
+            first, other = sorted(self._strings[c] for c in codes)[:2]
+            raise ValueError(f'Cannot add different currencies: {first} and {other}')
+        currency = self._strings[codes.pop()] if codes else "THB"
+        return Money(amount=sum(self._case_totals), currency=currency)
+
+    def _build_ticket(self, row: int, tracking: TrackingNumber) -> ClaimTicket:
+        # ข้อมูลถูกตรวจแล้วตอน put จึงใช้ model_construct ข้ามการตรวจซ้ำ
+        return ClaimTicket.model_construct(
+            ticket_id=TicketId.model_construct(value=self._ticket_ids[row]),
+            tracking_number=tracking,
+            compensation_amount=Money.model_construct(
+                amount=self._amounts[row], currency=self._strings[self._currency_codes[row]]
+            ),
+            version=self._versions[row],
+        )
+
+    def _build_case(self, pos: int) -> ClaimCase:
+        start = self._case_starts[pos]
+        tracking_value = self._case_tracking_values[pos]
+        return ClaimCase.model_construct(
+            tracking_number=TrackingNumber.model_construct(value=tracking_value),
+            tickets=[
+                self._build_ticket(row, TrackingNumber.model_construct(value=tracking_value))
+                for row in range(start, start + self._case_counts[pos])
+            ],
+            total_compensation=Money.model_construct(
+                amount=self._case_totals[pos], currency=self._strings[self._case_total_currency_codes[pos]]
+            ),
+        )
+
+
+class ColumnarClaimRepository(ClaimRepository):
+    """
+    Repository ที่เก็บข้อมูลใน ClaimCaseStore
+    - ถ้าจะสแกนทั้งหมด ให้ใช้ iter_cases() (สร้างทีละเคส) หรือ total_amount() (อ่านจากคอลัมน์ตรงๆ)
+    - get_all_cases() มีไว้ตามสัญญาของ ClaimRepository แต่สร้าง object ทุกเคสพร้อมกัน กิน RAM เท่า InMemory
+    หมายเหตุ: object ที่ได้จาก get_* / iter_cases เป็นสำเนา ถ้าแก้ไขแล้วต้อง save() กลับเข้ามา
+    """
+    def __init__(self):
+        self._store = ClaimCaseStore()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, tracking: TrackingNumber) -> bool:
+        return tracking.value in self._store
+
+    @property
+    def ticket_count(self) -> int:
+        return self._store.ticket_count
+
+    @property
+    def row_count(self) -> int:
+        return self._store.row_count
+
+    def save(self, claim_case: ClaimCase):
+        self._store.put(claim_case)
+
+    def get_by_tracking(self, tracking: TrackingNumber) -> Optional[ClaimCase]:
+        return self._store.get(tracking.value)
+
+    def get_all_cases(self) -> List[ClaimCase]:
+        return list(self._store.cases())
+
+    def iter_cases(self) -> Iterator[ClaimCase]:
+        return self._store.cases()
+
+    def total_amount(self) -> Money:
+        return self._store.total_amount()
+
+
 # ==========================================
 # 🧠 5. Domain Services
 # ==========================================
@@ -7,6 +7,7 @@ import os
 from domain.TrackingNumber import TrackingNumber, Money, TicketId, ClaimTicket, ClaimCase
 from domain.TrackingNumber import InMemoryClaimRepository, PandasClaimRepository
 from domain.TrackingNumber import ClaimEnrichmentService, ClaimRepository
+from domain.TrackingNumber import ClaimCaseStore, ColumnarClaimRepository
 
 # -----------------------------------------
 # Test Cases สำหรับ TrackingNumber
@@ -376,3 +377,212 @@ def test_claim_ticket_version_increments_on_update():
     assert ticket.version == 3
 
     print(f"✅ Test 20 Passed: ระบบติดตามเวอร์ชันของ {ticket.ticket_id.value} ทำงานถูกต้อง!")
+
+
+# -----------------------------------------
+# Test Cases: Columnar Repository (เก็บเป็นคอลัมน์)
+# -----------------------------------------
+
+def test_columnar_repo_returns_same_domain_api():
+    # 1. [Arrange] เตรียมเคสที่มีใบเคลม 2 ใบ
+    tn = TrackingNumber(value="TH1234567890")
+    claim_case = ClaimCase(tracking_number=tn)
+    claim_case.add_ticket(ClaimTicket(
+        ticket_id=TicketId(value="CMP-1001"),
+        tracking_number=tn,
+        compensation_amount=Money(amount=500, currency="THB")
+    ))
+    claim_case.add_ticket(ClaimTicket(
+        ticket_id=TicketId(value="CMP-1002"),
+        tracking_number=tn,
+        compensation_amount=Money(amount=300, currency="THB"),
+        version=3
+    ))
+
+    # 2. [Act] เซฟลง Columnar แล้วดึงกลับมา
+    repo = ColumnarClaimRepository()
+    repo.save(claim_case)
+    result = repo.get_by_tracking(tn)
+
+    # 3. [Assert] ได้ ClaimCase หน้าตาเหมือนเดิมทุกอย่าง
+    assert isinstance(result, ClaimCase)
+    assert result == claim_case
+    assert [t.ticket_id.value for t in result.tickets] == ["CMP-1001", "CMP-1002"]
+    assert result.tickets[1].version == 3
+    assert result.total_compensation.amount == 800.0
+    assert repo.get_by_tracking(TrackingNumber(value="TH-NOT-FOUND")) is None
+
+
+def _make_columnar_case(tracking: str, amounts: list[float], currency: str = "THB") -> ClaimCase:
+    tn = TrackingNumber(value=tracking)
+    claim_case = ClaimCase(tracking_number=tn)
+    for i, amount in enumerate(amounts):
+        claim_case.add_ticket(ClaimTicket(
+            ticket_id=TicketId(value=f"{tracking}-TKT-{i}"),
+            tracking_number=tn,
+            compensation_amount=Money(amount=amount, currency=currency)
+        ))
+    return claim_case
+
+
+def test_columnar_repo_overwrites_in_place_when_count_unchanged():
+    repo = ColumnarClaimRepository()
+    repo.save(_make_columnar_case("TH-99999", [0, 0]))
+    rows_before = repo.row_count
+
+    # แก้ยอดเงินใบแรกแล้วเซฟกลับ (ใบเคลมจำนวนเท่าเดิม)
+    loaded = repo.get_by_tracking(TrackingNumber(value="TH-99999"))
+    loaded.tickets[0].update_compensation(Money(amount=1500, currency="THB"))
+    repo.save(loaded)
+
+    result = repo.get_by_tracking(TrackingNumber(value="TH-99999"))
+    assert repo.row_count == rows_before # ไม่จองแถวเพิ่ม
+    assert result.tickets[0].compensation_amount.amount == 1500.0
+    assert result.tickets[0].version == 2
+    assert result.tickets[1].version == 1
+
+
+def test_columnar_repo_shrink_drops_stale_tail_rows():
+    repo = ColumnarClaimRepository()
+    repo.save(_make_columnar_case("TH-SHRINK", [10, 20, 30]))
+    rows_before = repo.row_count
+
+    loaded = repo.get_by_tracking(TrackingNumber(value="TH-SHRINK"))
+    loaded.tickets = loaded.tickets[:1]
+    repo.save(loaded)
+
+    # ต้องได้กลับมาแค่ 1 ใบ ไม่มีแถวเก่าหลุดติดมา
+    result = repo.get_by_tracking(TrackingNumber(value="TH-SHRINK"))
+    assert [t.ticket_id.value for t in result.tickets] == ["TH-SHRINK-TKT-0"]
+    assert repo.row_count == rows_before
+
+    # ขยายกลับต้องใช้แถวที่เหลือไว้ ไม่จองเพิ่ม
+    repo.save(_make_columnar_case("TH-SHRINK", [1, 2, 3]))
+    assert repo.row_count == rows_before
+
+
+def test_columnar_repo_grows_case():
+    repo = ColumnarClaimRepository()
+    repo.save(_make_columnar_case("TH-GROW", [100]))
+    repo.save(_make_columnar_case("TH-OTHER", [5]))
+
+    loaded = repo.get_by_tracking(TrackingNumber(value="TH-GROW"))
+    loaded.add_ticket(ClaimTicket(
+        ticket_id=TicketId(value="TKT-NEW"),
+        tracking_number=TrackingNumber(value="TH-GROW"),
+        compensation_amount=Money(amount=50, currency="THB")
+    ))
+    repo.save(loaded)
+
+    result = repo.get_by_tracking(TrackingNumber(value="TH-GROW"))
+    assert [t.ticket_id.value for t in result.tickets] == ["TH-GROW-TKT-0", "TKT-NEW"]
+    assert result.total_compensation.amount == 150.0
+    assert repo.get_by_tracking(TrackingNumber(value="TH-OTHER")).total_compensation.amount == 5.0
+
+
+def test_claim_case_store_reuses_rows_for_case_at_end():
+    # เคสอยู่ท้ายสุด เซฟทุกครั้งที่เพิ่มใบเคลม -> ขยายต่อที่เดิม ไม่ copy ทั้งก้อน
+    store = ClaimCaseStore()
+    tn = TrackingNumber(value="TH-APPEND")
+    case = ClaimCase(tracking_number=tn)
+    for i in range(1000):
+        case.add_ticket(ClaimTicket(
+            ticket_id=TicketId(value=f"TKT-{i}"),
+            tracking_number=tn,
+            compensation_amount=Money(amount=1, currency="THB")
+        ))
+        store.put(case)
+
+    assert store.ticket_count == 1000
+    assert store.row_count == 1000
+
+
+def test_claim_case_store_rows_stay_bounded_when_cases_interleave():
+    # สองเคสสลับกันโต -> ต้องย้ายไปท้ายสุด แต่จองเผื่อ 2 เท่า แถวรวมต้องไม่โตแบบกำลังสอง
+    store = ClaimCaseStore()
+    cases = {}
+    for value in ("TH-LEFT", "TH-RIGHT"):
+        cases[value] = ClaimCase(tracking_number=TrackingNumber(value=value))
+    for i in range(100):
+        for value, case in cases.items():
+            case.add_ticket(ClaimTicket(
+                ticket_id=TicketId(value=f"{value}-{i}"),
+                tracking_number=case.tracking_number,
+                compensation_amount=Money(amount=1, currency="THB")
+            ))
+            store.put(case)
+
+    assert store.ticket_count == 200
+    assert store.row_count <= 4 * store.ticket_count
+    assert [t.ticket_id.value for t in store.get("TH-LEFT").tickets][-1] == "TH-LEFT-99"
+
+
+def test_claim_case_store_validates_on_put():
+    store = ClaimCaseStore()
+    claim_case = _make_columnar_case("TH-BAD-01", [100])
+
+    # แก้ field ตรงๆ ข้าม validation ของ Pydantic
+    claim_case.tickets[0].compensation_amount.amount = -1
+    with pytest.raises(ValueError, match="ยอดเงินต้องไม่ติดลบ"):
+        store.put(claim_case)
+
+    claim_case.tickets[0].compensation_amount.amount = 100
+    claim_case.total_compensation.currency = "thb"
+    with pytest.raises(ValueError, match="สกุลเงินไม่ถูกต้อง"):
+        store.put(claim_case)
+    claim_case.total_compensation.currency = "THB"
+
+    claim_case.tickets[0].compensation_amount.amount = 100
+    claim_case.tickets[0].tracking_number = TrackingNumber(value="TH-BAD-02")
+    with pytest.raises(ValueError, match="คนละเลข Tracking"):
+        store.put(claim_case)
+
+    assert len(store) == 0
+
+
+def test_claim_case_store_total_rejects_mixed_currencies():
+    store = ClaimCaseStore()
+    thb_case = _make_columnar_case("TH-THB-01", [100])
+    usd_case = _make_columnar_case("TH-USD-01", [10], currency="USD")
+    usd_case.total_compensation = Money(amount=10, currency="USD")
+
+    store.put(thb_case)
+    assert store.total_amount() == Money(amount=100, currency="THB")
+
+    store.put(usd_case)
+    with pytest.raises(ValueError, match="Cannot add different currencies: THB and USD"):
+        store.total_amount()
+
+
+def test_claim_case_store_scans_many_tickets():
+    store = ClaimCaseStore()
+    for c in range(50):
+        tn = TrackingNumber(value=f"TH-BULK-{c}")
+        case = ClaimCase(tracking_number=tn)
+        for i in range(20):
+            case.add_ticket(ClaimTicket(
+                ticket_id=TicketId(value=f"TKT-{c}-{i}"),
+                tracking_number=tn,
+                compensation_amount=Money(amount=10, currency="THB")
+            ))
+        store.put(case)
+
+    assert len(store) == 50
+    assert store.ticket_count == 1000
+    assert "TH-BULK-7" in store
+    assert store.total_amount().amount == 10000.0 # 10 * 20 * 50
+    assert sum(len(case.tickets) for case in store.cases()) == 1000
+
+
+def test_columnar_repo_streams_cases_and_totals():
+    repo = ColumnarClaimRepository()
+    for c in range(10):
+        repo.save(_make_columnar_case(f"TH-SCAN-{c}", [10, 20]))
+
+    # สแกนทีละเคสผ่าน iter_cases และรวมยอดจากคอลัมน์ โดยไม่ต้องเรียก get_all_cases
+    assert sum(len(case.tickets) for case in repo.iter_cases()) == 20
+    assert repo.total_amount() == Money(amount=300, currency="THB")
+    assert len(repo) == 10
+    assert repo.ticket_count == 20
+    assert TrackingNumber(value="TH-SCAN-3") in repo
+    assert TrackingNumber(value="TH-NOT-FOUND") not in repo